@@ -1,10 +1,13 @@
 ## Description: Streamlit dashboard for analyzing call center data
 
+import hashlib
+import io
+
+import numpy as np
 import pandas as pd
 import streamlit as st
 import plotly.express as px
-import seaborn as sns
-import matplotlib.pyplot as plt
+import plotly.graph_objects as go
 
 # ── Upload & Load ────────────────────────────────────────────────────────────────
 st.sidebar.header("🔄 Upload Cleaned Dataset")
@@ -15,168 +18,307 @@ if not uploaded_file:
     st.sidebar.info("Please upload your cleaned CSV to proceed.")
     st.stop()
 
-# Read in the uploaded CSV and parse dates
-df = pd.read_csv(uploaded_file, parse_dates=["Timestamp"])
-
-# ── Normalize & Rename Headers ───────────────────────────────────────────────────
-# Strip any extra whitespace from column names
-df.columns = df.columns.str.strip()
-# Rename to the names your analysis expects
-df = df.rename(columns={
-    "Agent Name:":        "Agent Name",
-    "Reason for Calling:":"Reason for Calling",
-    "New patient?":       "New patient?"
-})
-
-# ── Standardize “Reason for Calling” ──────────────────────────────────────────────
-df["Reason for Calling"] = (
-    df["Reason for Calling"]
-      .astype(str)
-      .str.strip()
-      .replace({"Follow Up": "Follow-up"})
-)
+# ── Per-Agent Aggregates ──────────────────────────────────────────────────────────
+def agent_stats(df: pd.DataFrame) -> pd.DataFrame:
+    """One groupby pass feeding both the leaderboard and the detailed summary."""
+    return df.groupby("Agent Name", observed=True, sort=False).agg(
+        Total_Calls       = ("Timestamp", "count"),
+        Avg_Idle_Time_min = ("Idle Time (min)", "mean"),
+        New_Bookings      = ("IsNew", "sum")
+    ).reset_index()
 
-# ── Feature Engineering ───────────────────────────────────────────────────────────
-df = df.sort_values(["Agent Name", "Timestamp"])
-df["Call Date"]       = df["Timestamp"].dt.date
-df["Day of Week"]     = df["Timestamp"].dt.day_name()
-df["Week Start"]      = df["Timestamp"].dt.to_period("W").apply(lambda r: r.start_time)
-df["Idle Time (min)"] = (
-    df.groupby("Agent Name")["Timestamp"]
-      .diff()
-      .dt.total_seconds() / 60
-)
+# ── Cached Ingest & Feature Engineering ──────────────────────────────────────────
+@st.cache_data(show_spinner=False)
+def load_and_prepare(file_bytes: bytes) -> tuple[pd.DataFrame, pd.DataFrame, float, str]:
+    """Parse the uploaded CSV and build every derived column and agent summary.
 
-# ── KPI Threshold ─────────────────────────────────────────────────────────────────
-call_counts_excl_kim = (
-    df["Agent Name"]
-      .value_counts()
-      .drop("Kim Villafuerte", errors="ignore")
-)
-threshold_75 = 0.75 * call_counts_excl_kim.max()
-
-# ── Summary by Agent ──────────────────────────────────────────────────────────────
-summary_by_agent = df.groupby("Agent Name").agg(
-    Total_Calls       = ("Timestamp", "count"),
-    Avg_Idle_Time_min = ("Idle Time (min)", "mean"),
-    New_Bookings      = ("New patient?", lambda x: (x == "Yes").sum())
-).reset_index()
-
-# ── Robust formatting of Avg Idle Time ────────────────────────────────────────────
-summary_by_agent["Avg Idle Time (min)"] = (
-    summary_by_agent["Avg_Idle_Time_min"]
-      .fillna(0)               # replace any NaN with zero
-      .round()                 # round to nearest whole minute
-      .astype(int)             # safe cast to int
-      .astype(str) + " mins"   # append units
-)
+    Keyed on the raw file bytes, so widget reruns skip the pandas work entirely.
+    Also returns a digest of those bytes that identifies the upload to later caches.
+    """
+    # Map the columns we use back to their raw header text, which may carry
+    # stray whitespace, so usecols/parse_dates match whatever the file has
+    wanted = {"Timestamp", "Agent Name:", "Reason for Calling:", "New patient?"}
+    header = pd.read_csv(io.BytesIO(file_bytes), nrows=0).columns
+    raw_cols = [c for c in header if c.strip() in wanted]
+    raw_timestamp = [c for c in raw_cols if c.strip() == "Timestamp"]
+
+    # Read in the uploaded CSV with Arrow's parser, keeping only the columns we use
+    df = pd.read_csv(
+        io.BytesIO(file_bytes),
+        engine="pyarrow",
+        parse_dates=raw_timestamp,
+        usecols=raw_cols,
+    )
+
+    # ── Normalize & Rename Headers ───────────────────────────────────────────────
+    # Strip any extra whitespace from column names
+    df.columns = df.columns.str.strip()
+    # Rename to the names your analysis expects
+    df = df.rename(columns={
+        "Agent Name:":        "Agent Name",
+        "Reason for Calling:":"Reason for Calling",
+        "New patient?":       "New patient?"
+    })
+
+    # ── Standardize “Reason for Calling” ──────────────────────────────────────────
+    # Clean the handful of distinct labels once, then remap the integer codes
+    reason  = df["Reason for Calling"].astype("category")
+    cleaned = (
+        reason.cat.categories
+          .astype(str)             # empty or coded reason columns read as numbers
+          .str.strip()
+          .to_series()
+          .replace({"Follow Up": "Follow-up"})
+    )
+    categories = pd.Index(cleaned.unique()).sort_values()
+    recode = np.append(categories.get_indexer(cleaned), -1)   # code -1 (missing) stays -1
+    df["Reason for Calling"] = pd.Categorical.from_codes(
+        recode[reason.cat.codes.to_numpy()], categories=categories
+    )
+
+    # ── Flag New-Patient Bookings ─────────────────────────────────────────────────
+    df["IsNew"] = df["New patient?"].fillna("No").to_numpy() == "Yes"
+
+    # ── Feature Engineering ───────────────────────────────────────────────────────
+    df["Agent Name"] = df["Agent Name"].astype("category")
+    df = df.sort_values(["Agent Name", "Timestamp"])
+    df["Call Date"]       = df["Timestamp"].dt.date
+    df["Day of Week"]     = df["Timestamp"].dt.day_name()
+    # Monday of each call's week (same as to_period("W").start_time, vectorized)
+    df["Week Start"]      = (
+        df["Timestamp"] - pd.to_timedelta(df["Timestamp"].dt.weekday, unit="D")
+    ).dt.normalize()
+    # Rows are sorted by (agent, time): gap to the previous row, blanked
+    # wherever a new agent's block starts
+    ts    = df["Timestamp"].to_numpy()
+    codes = df["Agent Name"].cat.codes.to_numpy()
+    idle  = np.full(len(ts), np.nan)
+    idle[1:] = (ts[1:] - ts[:-1]) / np.timedelta64(1, "m")
+    new_agent = np.ones(len(codes), dtype=bool)
+    new_agent[1:] = codes[1:] != codes[:-1]
+    idle[new_agent | (codes == -1)] = np.nan
+    df["Idle Time (min)"] = idle
+    df["Booking Type"] = (
+        df["New patient?"]
+          .fillna("No")
+          .map({"Yes":"New","No":"Established"})
+    )
+
+    # Low-cardinality string columns → category codes for cheap groupby/filter
+    for col in ["New patient?", "Day of Week"]:
+        df[col] = df[col].astype("category")
+
+    # ── KPI Threshold ─────────────────────────────────────────────────────────────
+    call_counts_excl_kim = (
+        df["Agent Name"]
+          .value_counts()
+          .drop("Kim Villafuerte", errors="ignore")
+    )
+    threshold_75 = 0.75 * call_counts_excl_kim.max()
+
+    # ── Summary by Agent ──────────────────────────────────────────────────────────
+    summary_by_agent = agent_stats(df)
+
+    # ── Whole-minute Avg Idle Time (units are added at render time) ──────────────
+    summary_by_agent["Avg_Idle_Time_min"] = (
+        summary_by_agent["Avg_Idle_Time_min"]
+          .fillna(0)               # replace any NaN with zero
+          .round()                 # round to nearest whole minute
+          .astype("int32")         # stays numeric, so it sorts and serializes fast
+    )
+
+    file_key = hashlib.blake2b(file_bytes, digest_size=16).hexdigest()
+    return df, summary_by_agent, threshold_75, file_key
+
+df, summary_by_agent, threshold_75, file_key = load_and_prepare(uploaded_file.getvalue())
 
 # ── Weekday Order ─────────────────────────────────────────────────────────────────
 WEEKDAYS = ["Monday","Tuesday","Wednesday","Thursday","Friday"]
 
+# ── Cache Limits ──────────────────────────────────────────────────────────────────
+# Caches keyed on filter results are shared by every session; cap how many
+# filter combinations they keep and let stale ones expire
+VIEW_CACHE_ENTRIES = 32
+VIEW_CACHE_TTL     = "1h"
+
 # ── Sidebar Filters ──────────────────────────────────────────────────────────────
 st.sidebar.header("🔎 Filter Options")
 agent_filter  = st.sidebar.multiselect("Agent(s)", df["Agent Name"].unique())
 reason_filter = st.sidebar.multiselect("Reason(s)", df["Reason for Calling"].unique())
 date_filter   = st.sidebar.date_input("Date range", [])
 
+# Combine every filter into one mask and slice the frame once
+mask = np.ones(len(df), dtype=bool)
 if agent_filter:
-    df = df[df["Agent Name"].isin(agent_filter)]
+    mask &= df["Agent Name"].isin(agent_filter).to_numpy()
 if reason_filter:
-    df = df[df["Reason for Calling"].isin(reason_filter)]
-if isinstance(date_filter, list) and len(date_filter) == 2:
+    mask &= df["Reason for Calling"].isin(reason_filter).to_numpy()
+if len(date_filter) == 2:   # date_input returns a tuple; one date while picking
     start, end = date_filter
-    df = df[(df["Call Date"] >= start) & (df["Call Date"] <= end)]
+    mask &= df["Call Date"].between(start, end).to_numpy()   # NaT → False
+filters_active = not mask.all()
+if filters_active:
+    df = df.loc[mask]
 
-# ── Tabs ──────────────────────────────────────────────────────────────────────────
-tab1, tab2 = st.tabs(["📊 Client View", "👤 Agent View"])
+# ── Client View Aggregates ────────────────────────────────────────────────────────
+def _df_key(df: pd.DataFrame) -> int:
+    """Content hash of the filtered rows via pandas' vectorized row hashing.
 
-# ── Client View ──────────────────────────────────────────────────────────────────
-with tab1:
-    st.title("📊 Client View Dashboard")
+    Timestamp determines every date-derived column, so hashing it plus the
+    categorical columns covers everything the cached aggregations read.
+    """
+    cols = ["Timestamp", "Agent Name", "Reason for Calling", "New patient?"]
+    return int(pd.util.hash_pandas_object(df[cols], index=False).sum())
 
-    # 1️⃣ Daily Call Volume
-    daily = df.groupby("Call Date").size().reset_index(name="Calls")
-    fig1 = px.line(daily, x="Call Date", y="Calls", title="Daily Call Volume")
-    fig1.update_layout(yaxis=dict(tickformat=","), xaxis_title="")
-    st.plotly_chart(fig1, use_container_width=True)
+@st.cache_data(show_spinner=False, max_entries=VIEW_CACHE_ENTRIES, ttl=VIEW_CACHE_TTL)
+def client_aggs(file_key: str, df_key: int, _df: pd.DataFrame) -> dict[str, pd.DataFrame]:
+    """All Client View aggregations in one cache entry.
 
-    # 2️⃣ Weekly Call Volume
+    The frame itself is not hashed (leading underscore); ``file_key`` pins the
+    upload and ``df_key`` the filtered rows within it.
+    """
+    df = _df
+    daily  = df.groupby("Call Date").size().reset_index(name="Calls")
     weekly = df.groupby("Week Start").size().reset_index(name="Calls")
-    st.subheader("📅 Weekly Call Volume")
-    fig2 = px.bar(
-        weekly,
-        x="Week Start", y="Calls",
-        labels={"Week Start":"Week Starting","Calls":"# Calls"},
-        title="Weekly Call Volume"
-    )
-    fig2.update_layout(xaxis_tickangle=45, yaxis=dict(tickformat=","), xaxis_title="")
-    st.plotly_chart(fig2, use_container_width=True)
-
-    # 3️⃣ Call Volume by Day of Week (Mon–Fri)
-    dow_counts = (
-        df[df["Day of Week"].isin(WEEKDAYS)]
-          .groupby("Day of Week")
-          .size()
+    # Count every day straight off the codes; reindex keeps Mon–Fri, no weekday slice
+    dow = (
+        df["Day of Week"]
+          .value_counts(sort=False)
           .reindex(WEEKDAYS, fill_value=0)
+          .rename_axis("Day of Week")
           .reset_index(name="Calls")
     )
-    st.subheader("📆 Call Volume by Day of Week (Mon–Fri)")
-    fig3 = px.bar(
-        dow_counts,
-        x="Day of Week", y="Calls",
-        category_orders={"Day of Week": WEEKDAYS},
-        title="Call Volume by Day (Mon–Fri)"
-    )
-    fig3.update_layout(yaxis=dict(tickformat=","), xaxis_title="")
-    st.plotly_chart(fig3, use_container_width=True)
-
-    # 4️⃣ Top 10 Reasons for Calling (Percentage View)
+    # One count pass; percentages are of all calls with a reason, not just the top 10
+    reason_counts = df["Reason for Calling"].value_counts()
     reasons_pct = (
-        df["Reason for Calling"]
-          .value_counts(normalize=True)
-          .mul(100)
+        reason_counts
+          .loc[lambda s: s > 0]    # categorical counts include unused reasons
           .head(10)
-          .reset_index()
+          .rename_axis("Reason")
+          .reset_index(name="Count")
     )
-    reasons_pct.columns = ["Reason", "Percent"]
-    reasons_pct["Count"] = df["Reason for Calling"].value_counts().head(10).values
-    st.subheader("📋 Top 10 Reasons for Calling (by % of Total)")
-    fig4 = px.bar(
+    total = reason_counts.sum()
+    reasons_pct.insert(1, "Percent", reasons_pct["Count"] * 100.0 / total if total else 0.0)
+    reasons_pct["Label"] = [
+        f"{pct:.1f}%  ({n})" for pct, n in zip(reasons_pct["Percent"], reasons_pct["Count"])
+    ]
+    booking = df["Booking Type"].value_counts().reset_index()
+    booking.columns = ["Booking Type","Count"]
+    return dict(daily=daily, weekly=weekly, dow=dow, reasons_pct=reasons_pct, booking=booking)
+
+# ── Cached Figures ────────────────────────────────────────────────────────────────
+# Inputs are the small aggregated frames, so hashing them is cheap and an
+# unchanged aggregate hands back the already-built figure
+cache_fig = st.cache_resource(
+    show_spinner=False, max_entries=VIEW_CACHE_ENTRIES, ttl=VIEW_CACHE_TTL
+)
+
+@cache_fig
+def build_daily_fig(daily: pd.DataFrame) -> go.Figure:
+    """WebGL line; stable uirevision keeps zoom across reruns."""
+    fig = go.Figure(go.Scattergl(x=daily["Call Date"], y=daily["Calls"], mode="lines"))
+    fig.update_layout(
+        title="Daily Call Volume", uirevision="daily",
+        yaxis=dict(tickformat=","), xaxis_title="", yaxis_title="Calls"
+    )
+    return fig
+
+@cache_fig
+def build_weekly_fig(weekly: pd.DataFrame) -> go.Figure:
+    fig = go.Figure(go.Bar(x=weekly["Week Start"], y=weekly["Calls"]))
+    fig.update_layout(
+        title="Weekly Call Volume", uirevision="weekly",
+        xaxis_tickangle=45, yaxis=dict(tickformat=","), xaxis_title="", yaxis_title="# Calls"
+    )
+    return fig
+
+@cache_fig
+def build_dow_fig(dow_counts: pd.DataFrame) -> go.Figure:
+    fig = go.Figure(go.Bar(x=dow_counts["Day of Week"], y=dow_counts["Calls"]))
+    fig.update_layout(
+        title="Call Volume by Day (Mon–Fri)", uirevision="dow",
+        xaxis=dict(categoryorder="array", categoryarray=WEEKDAYS),
+        yaxis=dict(tickformat=","), xaxis_title="", yaxis_title="Calls"
+    )
+    return fig
+
+@cache_fig
+def build_reasons_fig(reasons_pct: pd.DataFrame) -> go.Figure:
+    fig = px.bar(
         reasons_pct,
         x="Percent", y="Reason",
-        orientation="h", text="Percent",
+        orientation="h", text="Label",
         labels={"Percent":"% of Calls","Reason":""}
     )
-    fig4.update_traces(
-        texttemplate='%{text:.1f}%  (%{customdata[0]})',
-        customdata=reasons_pct[["Count"]].values,
-        textposition='inside'
+    fig.update_traces(textposition='inside')
+    fig.update_layout(yaxis={'categoryorder':'total ascending'}, xaxis_title="")
+    return fig
+
+@cache_fig
+def build_booking_fig(booking: pd.DataFrame) -> go.Figure:
+    return px.pie(booking, names="Booking Type", values="Count")
+
+@cache_fig
+def build_agent_fig(lb: pd.DataFrame) -> go.Figure:
+    fig = px.bar(lb, x="Agent Name", y="Calls", title="Calls by Agent")
+    fig.update_layout(yaxis=dict(tickformat=","), xaxis_title="")
+    return fig
+
+@cache_fig
+def build_heatmap_fig(hm: pd.DataFrame) -> go.Figure:
+    fig = px.imshow(
+        hm, text_auto="d", color_continuous_scale="Reds", aspect="auto",
+        labels={"x":"", "y":"Agent Name", "color":"Calls"},
+        title="All Agents: Calls by Day (Mon–Fri)"
     )
-    fig4.update_layout(yaxis={'categoryorder':'total ascending'}, xaxis_title="")
-    st.plotly_chart(fig4, use_container_width=True)
+    fig.update_layout(uirevision="heatmap")
+    return fig
+
+# ── Client View ──────────────────────────────────────────────────────────────────
+# Each tab body is a fragment. Neither tab has widgets of its own yet (no chart
+# selections, no inputs), so today both run on every full-script rerun; the
+# fragments are there so per-tab widgets added later rerun only their own tab
+@st.fragment
+def render_client_view(df: pd.DataFrame, file_key: str) -> None:
+    st.title("📊 Client View Dashboard")
+
+    aggs = client_aggs(file_key, _df_key(df), df)
+
+    # 1️⃣ Daily Call Volume
+    st.plotly_chart(build_daily_fig(aggs["daily"]), use_container_width=True)
+
+    # 2️⃣ Weekly Call Volume
+    st.subheader("📅 Weekly Call Volume")
+    st.plotly_chart(build_weekly_fig(aggs["weekly"]), use_container_width=True)
+
+    # 3️⃣ Call Volume by Day of Week (Mon–Fri)
+    st.subheader("📆 Call Volume by Day of Week (Mon–Fri)")
+    st.plotly_chart(build_dow_fig(aggs["dow"]), use_container_width=True)
+
+    # 4️⃣ Top 10 Reasons for Calling (Percentage View)
+    st.subheader("📋 Top 10 Reasons for Calling (by % of Total)")
+    st.plotly_chart(build_reasons_fig(aggs["reasons_pct"]), use_container_width=True)
 
     # 5️⃣ New vs Established Appointments
-    df["Booking Type"] = (
-        df["New patient?"]
-          .fillna("No")
-          .map({"Yes":"New","No":"Established"})
-    )
-    booking = df["Booking Type"].value_counts().reset_index()
-    booking.columns = ["Booking Type","Count"]
     st.subheader("🗓️ New vs Established Appointments")
-    fig5 = px.pie(booking, names="Booking Type", values="Count")
-    st.plotly_chart(fig5, use_container_width=True)
+    st.plotly_chart(build_booking_fig(aggs["booking"]), use_container_width=True)
 
 # ── Agent View ───────────────────────────────────────────────────────────────────
-with tab2:
+@st.fragment
+def render_agent_view(
+    df: pd.DataFrame,
+    summary_by_agent: pd.DataFrame,
+    threshold_75: float,
+    filters_active: bool,
+) -> None:
     st.title("👤 Agent Performance View")
 
-    # Leaderboard (exclude team lead, add rank)
-    lb = df.groupby("Agent Name").agg(
-        Calls     = ("Timestamp","count"),
-        New_Books = ("New patient?", lambda x:(x=="Yes").sum())
-    ).reset_index()
+    # Leaderboard (exclude team lead, add rank); reuse the cached per-agent
+    # aggregates unless the sidebar filters narrowed the data
+    stats = agent_stats(df) if filters_active else summary_by_agent
+    lb = stats[["Agent Name","Total_Calls","New_Bookings"]].rename(
+        columns={"Total_Calls":"Calls","New_Bookings":"New_Books"}
+    )
     lb = lb[lb["Agent Name"] != "Zayra Lopez"]
     lb["Meets 75%"] = lb["Calls"] >= threshold_75
     lb = lb.sort_values("Calls", ascending=False).reset_index(drop=True)
@@ -187,9 +329,7 @@ with tab2:
 
     # Calls by Agent
     st.subheader("📊 Calls by Agent")
-    fig_agent = px.bar(lb, x="Agent Name", y="Calls", title="Calls by Agent")
-    fig_agent.update_layout(yaxis=dict(tickformat=","), xaxis_title="")
-    st.plotly_chart(fig_agent, use_container_width=True)
+    st.plotly_chart(build_agent_fig(lb), use_container_width=True)
 
     # Underperformers
     st.subheader("⚠️ Underperformers (<75% of Top)")
@@ -201,40 +341,66 @@ with tab2:
 
     # Heatmap (Mon–Fri)
     st.subheader("🗓️ Call Activity Heatmap (Mon–Fri)")
-    hm = (
-        df[df["Day of Week"].isin(WEEKDAYS)]
-          .groupby(["Agent Name","Day of Week"])
-          .size()
-          .unstack(fill_value=0)
-          .reindex(columns=WEEKDAYS, fill_value=0)
-    )
-    fig, ax = plt.subplots(figsize=(12,6))
-    sns.heatmap(hm, annot=True, fmt='d', cmap='Reds', ax=ax)
-    ax.set_title("All Agents: Calls by Day (Mon–Fri)")
-    ax.set_xlabel("")
-    ax.set_ylabel("Agent Name")
-    st.pyplot(fig)
+    # Agent × weekday counts in one bincount over the category codes
+    agents = df["Agent Name"].cat.categories
+    agent_codes = df["Agent Name"].cat.codes.to_numpy()
+    day_lookup = np.append(                        # day code → weekday column, -1 otherwise
+        pd.Index(WEEKDAYS).get_indexer(df["Day of Week"].cat.categories), -1
+    )
+    day_pos = day_lookup[df["Day of Week"].cat.codes.to_numpy()]
+    keep = (day_pos >= 0) & (agent_codes >= 0)
+    counts = np.bincount(
+        agent_codes[keep] * len(WEEKDAYS) + day_pos[keep],
+        minlength=len(agents) * len(WEEKDAYS)
+    ).reshape(len(agents), len(WEEKDAYS))
+    hm = pd.DataFrame(
+        counts,
+        index=pd.Index(agents, name="Agent Name"),
+        columns=pd.Index(WEEKDAYS, name="Day of Week")
+    )
+    hm = hm[counts.sum(axis=1) > 0]                # agents with no weekday calls drop out
+    st.plotly_chart(build_heatmap_fig(hm), use_container_width=True)
 
     # Std Dev of Daily Calls (exclude team lead)
     st.subheader("📉 STD of Daily Call Volume (All Agents)")
-    daily_counts = (
-        df.groupby(["Agent Name","Call Date"])
-          .size()
-          .unstack(fill_value=0)
+    # Std over every date in view (days without calls count as zero), built from
+    # per-agent sums and sums of squares of the long per-day counts — no
+    # agent × date matrix
+    per_day   = df.groupby(["Agent Name","Call Date"], observed=True, sort=False).size()
+    n_days    = per_day.index.get_level_values("Call Date").nunique()  # dates with a known agent
+    totals    = per_day.groupby(level="Agent Name", observed=True).sum()
+    sq_totals = per_day.pow(2).groupby(level="Agent Name", observed=True).sum()
+    variance  = ((sq_totals - totals**2 / n_days) / (n_days - 1)).clip(lower=0)
+    std_all = (
+        np.sqrt(variance)
           .drop(index="Zayra Lopez", errors="ignore")
+          .round(2)
+          .reset_index(name="STD_Daily_Calls")
     )
-    std_all = daily_counts.std(axis=1).reset_index(name="STD_Daily_Calls")
-    std_all["STD_Daily_Calls"] = std_all["STD_Daily_Calls"].round(2)
     st.dataframe(std_all)
 
     # Detailed Summary by Agent (exclude team lead)
     st.subheader("✅ Detailed Summary by Agent")
     summary_display = summary_by_agent[summary_by_agent["Agent Name"] != "Zayra Lopez"] \
                          .set_index("Agent Name")
-    st.dataframe(summary_display)
+    st.dataframe(
+        summary_display,
+        column_config={
+            "Avg_Idle_Time_min": st.column_config.NumberColumn(
+                "Avg Idle Time (min)", format="%d mins"
+            )
+        }
+    )
     st.info(
         "ℹ️ Kim Villafuerte handles both inbound and outbound calls."
     )
     st.warning(
         "⚠️ Zayra Lopez is the team lead and is excluded from performance comparisons."
     )
+
+# ── Tabs ──────────────────────────────────────────────────────────────────────────
+tab1, tab2 = st.tabs(["📊 Client View", "👤 Agent View"])
+with tab1:
+    render_client_view(df, file_key)
+with tab2:
+    render_agent_view(df, summary_by_agent, threshold_75, filters_active)